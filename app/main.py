@@ -8,12 +8,13 @@ Run:
     python -m app.main
 """
 
+import threading
 from os import getenv
 from pathlib import Path
 
 from agno.os import AgentOS
 
-from dash.agents import dash, dash_knowledge, reasoning_dash
+from dash.agents import dash, dash_knowledge, reasoning_dash, warmup
 from db import get_postgres_db
 
 # ============================================================================
@@ -30,6 +31,10 @@ agent_os = AgentOS(
 
 app = agent_os.get_app()
 
+# Pay for connection setup and context building in the background, not on the first request
+if getenv("DASH_WARMUP", "1") == "1":
+    threading.Thread(target=warmup, name="dash-warmup", daemon=True).start()
+
 if __name__ == "__main__":
     agent_os.serve(
         app="main:app",
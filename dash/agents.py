@@ -5,11 +5,11 @@ Dash Agents
 Test: python -m dash.agents
 """
 
+from functools import cache
 from os import getenv
 
 from agno.agent import Agent
 from agno.knowledge import Knowledge
-from agno.knowledge.embedder.openai import OpenAIEmbedder
 from agno.learn import (
     LearnedKnowledgeConfig,
     LearningMachine,
@@ -21,40 +21,54 @@ from agno.models.openai import OpenAIResponses
 from agno.tools.mcp import MCPTools
 from agno.tools.reasoning import ReasoningTools
 from agno.tools.sql import SQLTools
-from agno.vectordb.pgvector import PgVector, SearchType
-
-from dash.context.business_rules import BUSINESS_CONTEXT
-from dash.context.semantic_model import SEMANTIC_MODEL_STR
-from dash.tools import create_introspect_schema_tool, create_save_validated_query_tool
-from db import db_url, get_postgres_db
+from agno.utils.log import logger
+from agno.vectordb.pgvector import HNSW, SearchType
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from dash.context.business_rules import get_business_context
+from dash.context.semantic_model import get_semantic_model_str
+from dash.embedder import CachedEmbedder
+from dash.tools import create_introspect_schema_tool, create_save_validated_query_tool, create_search_context_tool
+from dash.vectordb import RRFPgVector
+from db import db_url, get_db_engine, get_postgres_db
 
 # ============================================================================
 # Database & Knowledge
 # ============================================================================
 
 agent_db = get_postgres_db()
+db_engine = get_db_engine()
+
+# One embedder (and OpenAI client) shared by both knowledge bases, with repeated texts served from the embedding cache.
+# enable_batch lets async inserts embed all chunks of a file in one request.
+embedder = CachedEmbedder(id="text-embedding-3-small", enable_batch=True)
+
+
+def create_vector_db(table_name: str) -> RRFPgVector:
+    """Create a hybrid-search vector table on the shared engine and embedder."""
+    return RRFPgVector(
+        db_url=db_url,
+        db_engine=db_engine,
+        table_name=table_name,
+        search_type=SearchType.hybrid,
+        # ef_search is the minimum; hybrid search raises it when it needs more vector candidates
+        vector_index=HNSW(m=16, ef_construction=64, ef_search=40),
+        embedder=embedder,
+    )
+
 
 # KNOWLEDGE: Static, curated (table schemas, validated queries, business rules)
 dash_knowledge = Knowledge(
     name="Dash Knowledge",
-    vector_db=PgVector(
-        db_url=db_url,
-        table_name="dash_knowledge",
-        search_type=SearchType.hybrid,
-        embedder=OpenAIEmbedder(id="text-embedding-3-small"),
-    ),
+    vector_db=create_vector_db("dash_knowledge"),
     contents_db=get_postgres_db(contents_table="dash_knowledge_contents"),
 )
 
 # LEARNINGS: Dynamic, discovered (error patterns, gotchas, user corrections)
 dash_learnings = Knowledge(
     name="Dash Learnings",
-    vector_db=PgVector(
-        db_url=db_url,
-        table_name="dash_learnings",
-        search_type=SearchType.hybrid,
-        embedder=OpenAIEmbedder(id="text-embedding-3-small"),
-    ),
+    vector_db=create_vector_db("dash_learnings"),
     contents_db=get_postgres_db(contents_table="dash_learnings_contents"),
 )
 
@@ -63,10 +77,12 @@ dash_learnings = Knowledge(
 # ============================================================================
 
 save_validated_query = create_save_validated_query_tool(dash_knowledge)
-introspect_schema = create_introspect_schema_tool(db_url)
+introspect_schema = create_introspect_schema_tool(db_engine)
+search_context = create_search_context_tool(dash_knowledge, dash_learnings)
 
 base_tools: list = [
-    SQLTools(db_url=db_url),
+    search_context,
+    SQLTools(db_engine=db_engine),
     save_validated_query,
     introspect_schema,
     MCPTools(url=f"https://mcp.exa.ai/mcp?exaApiKey={getenv('EXA_API_KEY', '')}&tools=web_search_exa"),
@@ -76,7 +92,7 @@ base_tools: list = [
 # Instructions
 # ============================================================================
 
-INSTRUCTIONS = f"""\
+INSTRUCTIONS_TEMPLATE = """\
 You are Dash, a self-learning data agent that provides **insights**, not just query results.
 
 ## Your Purpose
@@ -93,17 +109,17 @@ Your goal: make the user look like they've been working with this data for years
 
 **Knowledge** (static, curated):
 - Table schemas, validated queries, business rules
-- Searched automatically before each response
+- Search with `search_context`
 - Add successful queries here with `save_validated_query`
 
 **Learnings** (dynamic, discovered):
 - Patterns YOU discover through errors and fixes
 - Type gotchas, date formats, column quirks
-- Search with `search_learnings`, save with `save_learning`
+- Search with `search_context`, save with `save_learning` (check for duplicates with `search_learnings` first)
 
 ## Workflow
 
-1. Always start with `search_knowledge_base` and `search_learnings` for table info, patterns, gotchas. Context that will help you write the best possible SQL.
+1. Always start with `search_context`, which searches knowledge and learnings together, for table info, patterns, gotchas. Context that will help you write the best possible SQL.
 2. Write SQL (LIMIT 50, no SELECT *, ORDER BY for rankings)
 3. If error → `introspect_schema` → fix → `save_learning`
 4. Provide **insights**, not just data, based on the context you found.
@@ -153,47 +169,72 @@ save_learning(
 
 ## SEMANTIC MODEL
 
-{SEMANTIC_MODEL_STR}
+{semantic_model}
 ---
 
-{BUSINESS_CONTEXT}\
+{business_context}\
 """
 
+
+@cache
+def get_instructions() -> str:
+    """Render the instructions on first use; the context is only built when an agent first runs."""
+    return INSTRUCTIONS_TEMPLATE.format(
+        semantic_model=get_semantic_model_str(),
+        business_context=get_business_context(),
+    )
+
+
 # ============================================================================
 # Create Agent
 # ============================================================================
 
-dash = Agent(
-    name="Dash",
-    model=OpenAIResponses(id="gpt-5.2"),
-    db=agent_db,
-    instructions=INSTRUCTIONS,
-    # Knowledge (static)
-    knowledge=dash_knowledge,
-    search_knowledge=True,
-    # Learning (provides search_learnings, save_learning, user profile, user memory)
-    learning=LearningMachine(
-        knowledge=dash_learnings,
-        user_profile=UserProfileConfig(mode=LearningMode.AGENTIC),
-        user_memory=UserMemoryConfig(mode=LearningMode.AGENTIC),
-        learned_knowledge=LearnedKnowledgeConfig(mode=LearningMode.AGENTIC),
-    ),
-    tools=base_tools,
-    # Context
-    add_datetime_to_context=True,
-    add_history_to_context=True,
-    read_chat_history=True,
-    num_history_runs=5,
-    markdown=True,
-)
+
+def create_dash(name: str, tools: list) -> Agent:
+    """Create a Dash agent. Knowledge, learnings, db and instructions are shared by reference."""
+    return Agent(
+        name=name,
+        # Instructions are static and precede the per-turn datetime, so the system prompt is a stable
+        # prefix; the cache key routes every turn of this agent to the same prompt cache
+        model=OpenAIResponses(id="gpt-5.2", request_params={"prompt_cache_key": name}),
+        db=agent_db,
+        instructions=get_instructions,
+        # Knowledge (static)
+        knowledge=dash_knowledge,
+        # search_context covers knowledge search, so the built-in search_knowledge_base tool is off
+        search_knowledge=False,
+        # Learning (provides search_learnings, save_learning, user profile, user memory)
+        learning=LearningMachine(
+            knowledge=dash_learnings,
+            user_profile=UserProfileConfig(mode=LearningMode.AGENTIC),
+            user_memory=UserMemoryConfig(mode=LearningMode.AGENTIC),
+            learned_knowledge=LearnedKnowledgeConfig(mode=LearningMode.AGENTIC),
+        ),
+        tools=tools,
+        # Context
+        add_datetime_to_context=True,
+        add_history_to_context=True,
+        read_chat_history=True,
+        num_history_runs=5,
+        markdown=True,
+    )
+
+
+dash = create_dash("Dash", list(base_tools))
 
 # Reasoning variant - adds multi-step reasoning capabilities
-reasoning_dash = dash.deep_copy(
-    update={
-        "name": "Reasoning Dash",
-        "tools": base_tools + [ReasoningTools(add_instructions=True)],
-    }
-)
+reasoning_dash = create_dash("Reasoning Dash", base_tools + [ReasoningTools(add_instructions=True)])
+
+
+def warmup() -> None:
+    """Open a pooled connection and render the instructions ahead of the first turn."""
+    try:
+        with db_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        get_instructions()
+    except (SQLAlchemyError, OSError, ValueError) as e:
+        logger.warning(f"Warmup failed: {e}")
+
 
 if __name__ == "__main__":
     dash.print_response("Who won the most races in 2019?", stream=True)
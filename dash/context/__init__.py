@@ -1,11 +1,14 @@
 """Context builders for Dash's system prompt."""
 
-from dash.context.business_rules import BUSINESS_CONTEXT, build_business_context, load_business_rules
+from typing import Any
+
+from dash.context import business_rules, semantic_model
+from dash.context.business_rules import build_business_context, get_business_context, load_business_rules
 from dash.context.semantic_model import (
-    SEMANTIC_MODEL,
-    SEMANTIC_MODEL_STR,
     build_semantic_model,
     format_semantic_model,
+    get_semantic_model,
+    get_semantic_model_str,
     load_table_metadata,
 )
 
@@ -13,9 +16,21 @@ __all__ = [
     "load_table_metadata",
     "build_semantic_model",
     "format_semantic_model",
+    "get_semantic_model",
+    "get_semantic_model_str",
     "SEMANTIC_MODEL",
     "SEMANTIC_MODEL_STR",
     "load_business_rules",
     "build_business_context",
+    "get_business_context",
     "BUSINESS_CONTEXT",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Context constants are built lazily on first access
+    if name in ("SEMANTIC_MODEL", "SEMANTIC_MODEL_STR"):
+        return getattr(semantic_model, name)
+    if name == "BUSINESS_CONTEXT":
+        return getattr(business_rules, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 """Load business definitions, metrics, and common gotchas."""
 
 import json
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -69,4 +70,14 @@ def build_business_context(business_dir: Path | None = None) -> str:
     return "\n".join(lines)
 
 
-BUSINESS_CONTEXT = build_business_context()
+@cache
+def get_business_context() -> str:
+    """Get the business context string, built on first use."""
+    return build_business_context()
+
+
+def __getattr__(name: str) -> Any:
+    # BUSINESS_CONTEXT is built lazily on first access
+    if name == "BUSINESS_CONTEXT":
+        return get_business_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 """Load table metadata for the system prompt."""
 
 import json
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -62,5 +63,22 @@ def format_semantic_model(model: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-SEMANTIC_MODEL = build_semantic_model()
-SEMANTIC_MODEL_STR = format_semantic_model(SEMANTIC_MODEL)
+@cache
+def get_semantic_model() -> dict[str, Any]:
+    """Get the semantic model, built on first use."""
+    return build_semantic_model()
+
+
+@cache
+def get_semantic_model_str() -> str:
+    """Get the formatted semantic model, built on first use."""
+    return format_semantic_model(get_semantic_model())
+
+
+def __getattr__(name: str) -> Any:
+    # SEMANTIC_MODEL and SEMANTIC_MODEL_STR are built lazily on first access
+    if name == "SEMANTIC_MODEL":
+        return get_semantic_model()
+    if name == "SEMANTIC_MODEL_STR":
+        return get_semantic_model_str()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
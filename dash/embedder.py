@@ -0,0 +1,115 @@
+"""OpenAI embedder with a persistent embedding cache."""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from agno.knowledge.embedder.openai import OpenAIEmbedder
+from agno.utils.log import logger
+
+from dash.paths import CACHE_DIR
+
+
+@dataclass
+class CachedEmbedder(OpenAIEmbedder):
+    """OpenAIEmbedder that stores embeddings in SQLite, keyed by sha256(model id + text).
+
+    Repeated search queries skip the OpenAI round-trip. Failed embeddings are not cached.
+    Vectors are stored as doubles, so cached embeddings match the API response exactly.
+    """
+
+    cache_path: Path = field(default_factory=lambda: CACHE_DIR / "embeddings.sqlite3")
+    ttl_seconds: int = 30 * 24 * 60 * 60
+
+    _conn: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS emb (key BLOB PRIMARY KEY, dim INT, vec BLOB, ts INT)")
+            # Drop expired entries once per process
+            conn.execute("DELETE FROM emb WHERE ts <= ?", (int(time.time()) - self.ttl_seconds,))
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(f"{self.id}\x00{self.dimensions}\x00{text}".encode()).digest()
+
+    def _get_cached(self, text: str) -> list[float] | None:
+        try:
+            with self._lock:
+                row = (
+                    self._connection()
+                    .execute(
+                        "SELECT dim, vec FROM emb WHERE key = ? AND ts > ?",
+                        (self._key(text), int(time.time()) - self.ttl_seconds),
+                    )
+                    .fetchone()
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        vec = array("d")
+        # Skip rows whose size doesn't match the stored dimension (e.g. written in another format)
+        if len(row[1]) != row[0] * vec.itemsize:
+            return None
+        vec.frombytes(row[1])
+        return vec.tolist()
+
+    def _set_cached(self, text: str, embedding: list[float]) -> None:
+        if not embedding:
+            return
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO emb (key, dim, vec, ts) VALUES (?, ?, ?, ?)",
+                    (self._key(text), len(embedding), array("d", embedding).tobytes(), int(time.time())),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    def get_embedding(self, text: str) -> list[float]:
+        cached = self._get_cached(text)
+        if cached is not None:
+            return cached
+        embedding = super().get_embedding(text)
+        self._set_cached(text, embedding)
+        return embedding
+
+    def get_embedding_and_usage(self, text: str) -> tuple[list[float], dict | None]:
+        cached = self._get_cached(text)
+        if cached is not None:
+            return cached, None
+        embedding, usage = super().get_embedding_and_usage(text)
+        self._set_cached(text, embedding)
+        return embedding, usage
+
+    # SQLite calls block, so the async methods run them in a worker thread
+
+    async def async_get_embedding(self, text: str) -> list[float]:
+        cached = await asyncio.to_thread(self._get_cached, text)
+        if cached is not None:
+            return cached
+        embedding = await super().async_get_embedding(text)
+        await asyncio.to_thread(self._set_cached, text, embedding)
+        return embedding
+
+    async def async_get_embedding_and_usage(self, text: str) -> tuple[list[float], dict | None]:
+        cached = await asyncio.to_thread(self._get_cached, text)
+        if cached is not None:
+            return cached, None
+        embedding, usage = await super().async_get_embedding_and_usage(text)
+        await asyncio.to_thread(self._set_cached, text, embedding)
+        return embedding, usage
@@ -18,10 +18,10 @@ from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 from rich.table import Table
 from rich.text import Text
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 
 from dash.evals.test_cases import CATEGORIES, TEST_CASES, TestCase
-from db import db_url
+from db import get_db_engine
 
 
 class EvalResult(TypedDict, total=False):
@@ -44,8 +44,7 @@ console = Console()
 
 def execute_golden_sql(sql: str) -> list[dict]:
     """Execute a golden SQL query and return results as list of dicts."""
-    engine = create_engine(db_url)
-    with engine.connect() as conn:
+    with get_db_engine().connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
         result = conn.execute(text(sql))
         columns = list(result.keys())
         return [dict(zip(columns, row)) for row in result.fetchall()]
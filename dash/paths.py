@@ -1,5 +1,6 @@
 """Path constants."""
 
+from os import getenv
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -8,3 +9,4 @@ KNOWLEDGE_DIR = DASH_DIR / "knowledge"
 TABLES_DIR = KNOWLEDGE_DIR / "tables"
 BUSINESS_DIR = KNOWLEDGE_DIR / "business"
 QUERIES_DIR = KNOWLEDGE_DIR / "queries"
+CACHE_DIR = Path(getenv("DASH_CACHE_DIR") or Path(getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "dash")
@@ -4,13 +4,13 @@ Load F1 Data - Downloads F1 data (1950-2020) and loads into PostgreSQL.
 Usage: python -m dash.scripts.load_data
 """
 
-from io import StringIO
+import asyncio
+from io import BytesIO
 
 import httpx
 import pandas as pd
-from sqlalchemy import create_engine
 
-from db import db_url
+from db import get_db_engine
 
 S3_URI = "https://agno-public.s3.amazonaws.com/f1"
 
@@ -22,14 +22,44 @@ TABLES = {
     "race_wins": f"{S3_URI}/race_wins_1950_to_2020.csv",
 }
 
+# Backoff between attempts; a download is tried len(RETRY_DELAYS) + 1 times
+RETRY_DELAYS = (0.5, 1.0, 2.0)
+
+
+async def fetch_csv(client: httpx.AsyncClient, url: str) -> bytes:
+    """Download one CSV, retrying network errors and 5xx responses with backoff."""
+    for delay in RETRY_DELAYS:
+        try:
+            response = await client.get(url)
+            if response.status_code < 500:
+                break
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(delay)
+    else:
+        # Final attempt; errors propagate
+        response = await client.get(url)
+    response.raise_for_status()
+    return response.content
+
+
+async def download_tables() -> dict[str, bytes]:
+    """Download every table's CSV concurrently."""
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        csvs = await asyncio.gather(*(fetch_csv(client, url) for url in TABLES.values()))
+    return dict(zip(TABLES, csvs))
+
+
 if __name__ == "__main__":
-    engine = create_engine(db_url)
+    engine = get_db_engine()
     total = 0
 
-    for table, url in TABLES.items():
+    print("Downloading F1 data...", flush=True)
+    csvs = asyncio.run(download_tables())
+
+    for table, csv in csvs.items():
         print(f"Loading {table}...", end=" ", flush=True)
-        response = httpx.get(url, timeout=30.0)
-        df = pd.read_csv(StringIO(response.text))
+        df = pd.read_csv(BytesIO(csv))
         df.to_sql(table, engine, if_exists="replace", index=False)
         print(f"{len(df):,} rows")
         total += len(df)
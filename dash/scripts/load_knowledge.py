@@ -7,6 +7,9 @@ Usage:
 """
 
 import argparse
+import asyncio
+
+from agno.knowledge.knowledge import ContentDict
 
 from dash.paths import KNOWLEDGE_DIR
 
@@ -29,6 +32,7 @@ if __name__ == "__main__":
 
     print(f"Loading knowledge from: {KNOWLEDGE_DIR}\n")
 
+    contents: list[ContentDict] = []
     for subdir in ["tables", "queries", "business"]:
         path = KNOWLEDGE_DIR / subdir
         if not path.exists():
@@ -39,6 +43,10 @@ if __name__ == "__main__":
         print(f"  {subdir}/: {len(files)} files")
 
         if files:
-            dash_knowledge.insert(name=f"knowledge-{subdir}", path=str(path))
+            contents.append({"name": f"knowledge-{subdir}", "path": str(path)})
+
+    # Directories load one after another; the async path embeds each file's chunks in one request
+    if contents:
+        asyncio.run(dash_knowledge.ainsert_many(contents))
 
     print("\nDone!")
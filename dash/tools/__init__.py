@@ -2,8 +2,10 @@
 
 from dash.tools.introspect import create_introspect_schema_tool
 from dash.tools.save_query import create_save_validated_query_tool
+from dash.tools.search import create_search_context_tool
 
 __all__ = [
     "create_introspect_schema_tool",
     "create_save_validated_query_tool",
+    "create_search_context_tool",
 ]
@@ -1,14 +1,24 @@
 """Runtime schema inspection (Layer 6)."""
 
+import time
+
 from agno.tools import tool
 from agno.utils.log import logger
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import Engine, inspect, text
 from sqlalchemy.exc import DatabaseError, OperationalError
 
+# The table listing runs COUNT(*) on every table; reuse it for repeated calls within a turn
+TABLE_LIST_TTL_SECONDS = 60.0
+
 
-def create_introspect_schema_tool(db_url: str):
+def create_introspect_schema_tool(db_engine: Engine):
     """Create introspect_schema tool with database connection."""
-    engine = create_engine(db_url)
+    # Read-only tool: autocommit skips the BEGIN/ROLLBACK round-trips around every checkout.
+    # The option applies per connection, so the tool still shares the engine's pool.
+    engine = db_engine.execution_options(isolation_level="AUTOCOMMIT")
+    quote = engine.dialect.identifier_preparer.quote
+    # (monotonic time built, rendered table listing)
+    table_list_cache: tuple[float, str] | None = None
 
     @tool
     def introspect_schema(
@@ -23,10 +33,14 @@ def create_introspect_schema_tool(db_url: str):
             include_sample_data: Include sample rows.
             sample_limit: Number of sample rows.
         """
+        nonlocal table_list_cache
         try:
             insp = inspect(engine)
 
             if table_name is None:
+                if table_list_cache and time.monotonic() - table_list_cache[0] < TABLE_LIST_TTL_SECONDS:
+                    return table_list_cache[1]
+
                 # List all tables
                 tables = insp.get_table_names()
                 if not tables:
@@ -36,11 +50,13 @@ def create_introspect_schema_tool(db_url: str):
                 for t in sorted(tables):
                     try:
                         with engine.connect() as conn:
-                            count = conn.execute(text(f'SELECT COUNT(*) FROM "{t}"')).scalar()
+                            count = conn.execute(text(f"SELECT COUNT(*) FROM {quote(t)}")).scalar()
                             lines.append(f"- **{t}** ({count:,} rows)")
                     except (OperationalError, DatabaseError):
                         lines.append(f"- **{t}**")
-                return "\n".join(lines)
+                table_list = "\n".join(lines)
+                table_list_cache = (time.monotonic(), table_list)
+                return table_list
 
             # Inspect specific table
             tables = insp.get_table_names()
@@ -69,15 +85,17 @@ def create_introspect_schema_tool(db_url: str):
                 lines.append("### Sample")
                 try:
                     with engine.connect() as conn:
-                        result = conn.execute(text(f'SELECT * FROM "{table_name}" LIMIT {sample_limit}'))
+                        result = conn.execute(
+                            text(f"SELECT * FROM {quote(table_name)} LIMIT :limit"), {"limit": sample_limit}
+                        )
                         rows = result.fetchall()
                         col_names = list(result.keys())
                         if rows:
                             lines.append("| " + " | ".join(col_names) + " |")
                             lines.append("| " + " | ".join(["---"] * len(col_names)) + " |")
-                            for row in rows:
-                                vals = [str(v)[:30] if v else "NULL" for v in row]
-                                lines.append("| " + " | ".join(vals) + " |")
+                            lines.extend(
+                                "| " + " | ".join(str(v)[:30] if v else "NULL" for v in row) + " |" for row in rows
+                            )
                         else:
                             lines.append("_No data_")
                 except (OperationalError, DatabaseError) as e:
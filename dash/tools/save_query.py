@@ -7,9 +7,14 @@ from agno.knowledge.reader.text_reader import TextReader
 from agno.tools import tool
 from agno.utils.log import logger
 
+# Keywords rejected in saved queries, checked in this order
+DANGEROUS_KEYWORDS = ("drop", "delete", "truncate", "insert", "update", "alter", "create")
+
 
 def create_save_validated_query_tool(knowledge: Knowledge):
     """Create save_validated_query tool with knowledge injected."""
+    # TextReader holds only configuration, so one instance serves every save
+    reader = TextReader()
 
     @tool
     def save_validated_query(
@@ -43,9 +48,9 @@ def create_save_validated_query_tool(knowledge: Knowledge):
         if not sql.startswith("select") and not sql.startswith("with"):
             return "Error: Only SELECT queries can be saved."
 
-        dangerous = ["drop", "delete", "truncate", "insert", "update", "alter", "create"]
-        for kw in dangerous:
-            if f" {kw} " in f" {sql} ":
+        words = frozenset(sql.split())
+        for kw in DANGEROUS_KEYWORDS:
+            if kw in words:
                 return f"Error: Query contains dangerous keyword: {kw}"
 
         payload = {
@@ -62,8 +67,9 @@ def create_save_validated_query_tool(knowledge: Knowledge):
         try:
             knowledge.insert(
                 name=name.strip(),
+                # skip_if_exists compares content hashes, so the encoding must match already-saved queries
                 text_content=json.dumps(payload, ensure_ascii=False, indent=2),
-                reader=TextReader(),
+                reader=reader,
                 skip_if_exists=True,
             )
             return f"Saved query '{name}' to knowledge base."
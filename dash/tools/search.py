@@ -0,0 +1,49 @@
+"""Search knowledge and learnings in one call."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from agno.knowledge import Knowledge
+from agno.learn import LearnedKnowledgeConfig, LearnedKnowledgeStore
+from agno.tools import tool
+
+
+def create_search_context_tool(knowledge: Knowledge, learnings: Knowledge):
+    """Create search_context tool that queries knowledge and learnings concurrently."""
+    learnings_store = LearnedKnowledgeStore(config=LearnedKnowledgeConfig(knowledge=learnings))
+    # Sync so the tool also works with agent.run() and print_response(); one thread per source
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-context")
+
+    @tool
+    def search_context(query: str, limit: int = 5) -> str:
+        """Search the knowledge base and learnings at once. Call this first for every question.
+
+        Args:
+            query: Keywords describing the tables, metrics or question.
+            limit: Maximum results from each source (default: 5).
+        """
+        # Embed once up front; both searches then read the vector from the embedding cache.
+        # The embedder and both searches log and swallow their own errors.
+        embedder = knowledge.vector_db.embedder if knowledge.vector_db else None
+        if embedder is not None:
+            embedder.get_embedding(query)
+
+        docs_future = executor.submit(knowledge.search, query=query, max_results=limit)
+        learned_future = executor.submit(learnings_store.search, query=query, namespace="global", limit=limit)
+        docs, learned = docs_future.result(), learned_future.result()
+
+        lines = ["## Knowledge", ""]
+        if docs:
+            lines.extend(f"{i}. {doc.content}" for i, doc in enumerate(docs, 1))
+        else:
+            lines.append("_No documents found_")
+
+        lines.extend(["", "## Learnings", ""])
+        if learned:
+            for i, learning in enumerate(learned, 1):
+                lines.append(f"{i}. **{learning.title}**\n   {learning.learning}")
+        else:
+            lines.append("_No relevant learnings found_")
+
+        return "\n".join(lines)
+
+    return search_context
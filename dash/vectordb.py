@@ -0,0 +1,136 @@
+"""PgVector with reciprocal rank fusion for hybrid search."""
+
+from typing import Any
+
+from agno.knowledge.document import Document
+from agno.utils.log import logger
+from agno.vectordb.pgvector import HNSW, Distance, PgVector
+from sqlalchemy import and_, bindparam, func, select, text
+from sqlalchemy.exc import SQLAlchemyError
+
+# Standard RRF damping constant: a document's score is sum(1 / (k + rank)) over result lists
+RRF_K = 60
+
+# Candidates fetched from each ranking per requested result
+RRF_CANDIDATES_PER_RESULT = 4
+
+
+class RRFPgVector(PgVector):
+    """PgVector whose hybrid search fuses vector and keyword rankings with reciprocal rank fusion.
+
+    agno's built-in hybrid search adds weighted vector and normalized ts_rank scores, which
+    live on different scales. RRF only uses each document's rank in the two lists.
+    """
+
+    def hybrid_search(self, query: str, limit: int = 5, filters: Any = None) -> list[Document]:
+        candidates = limit * RRF_CANDIDATES_PER_RESULT
+
+        # The embedding column is not needed to build results, so it is not fetched
+        columns = [self.table.c.id, self.table.c.name, self.table.c.meta_data, self.table.c.content, self.table.c.usage]
+
+        # Keyword ranking only includes documents that match the query
+        ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
+        ts_query = func.websearch_to_tsquery(
+            self.content_language,
+            bindparam("query", value=self.enable_prefix_matching(query) if self.prefix_match else query),
+        )
+        keyword_stmt = (
+            self._apply_filters(select(*columns), filters)
+            .where(ts_vector.bool_op("@@")(ts_query))
+            .order_by(func.ts_rank_cd(ts_vector, ts_query).desc())
+            .limit(candidates)
+        )
+
+        query_embedding = self.embedder.get_embedding(query)
+        ranked_lists = []
+        try:
+            with self.Session() as sess, sess.begin():
+                if query_embedding:
+                    if isinstance(self.vector_index, HNSW):
+                        # An HNSW index scan returns at most ef_search rows, so widen it to the candidate count
+                        ef_search = max(int(self.vector_index.ef_search), candidates)
+                        sess.execute(text(f"SET LOCAL hnsw.ef_search = {ef_search}"))
+                    vector_stmt = (
+                        self._apply_filters(select(*columns), filters)
+                        .order_by(self._distance(query_embedding))
+                        .limit(candidates)
+                    )
+                    ranked_lists.append(sess.execute(vector_stmt).fetchall())
+                ranked_lists.append(sess.execute(keyword_stmt).fetchall())
+        except SQLAlchemyError as e:
+            logger.error(f"Hybrid search failed: {e}")
+            return []
+
+        scores: dict[str, float] = {}
+        rows: dict[str, Any] = {}
+        for results in ranked_lists:
+            for rank, row in enumerate(results, start=1):
+                scores[row.id] = scores.get(row.id, 0.0) + 1 / (RRF_K + rank)
+                rows.setdefault(row.id, row)
+
+        fused = sorted(scores, key=scores.__getitem__, reverse=True)[:limit]
+        search_results = [
+            Document(
+                id=rows[doc_id].id,
+                name=rows[doc_id].name,
+                meta_data=rows[doc_id].meta_data,
+                content=rows[doc_id].content,
+                embedder=self.embedder,
+                usage=rows[doc_id].usage,
+            )
+            for doc_id in fused
+        ]
+
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+        return search_results
+
+    def create(self) -> None:
+        """Create the table if it does not exist, then its HNSW index."""
+        super().create()
+        self.create_vector_index()
+
+    def create_vector_index(self) -> None:
+        """Build the HNSW index on the embedding column if it does not exist yet.
+
+        agno 2.4.7's optimize() can't be used under psycopg 3: it sends the index settings as
+        bound parameters, which Postgres rejects in DDL, and its GIN index DDL leaves the
+        text-search config unquoted. The values here are ints, so they are inlined.
+        """
+        if not isinstance(self.vector_index, HNSW):
+            return
+        preparer = self.db_engine.dialect.identifier_preparer
+        name = preparer.quote(self.vector_index.name or f"{self.table_name}_hnsw_index")
+        qualified_name = f"{preparer.quote_schema(self.schema)}.{name}" if self.schema else name
+        opclass = {Distance.l2: "vector_l2_ops", Distance.max_inner_product: "vector_ip_ops"}.get(
+            self.distance, "vector_cosine_ops"
+        )
+        with self.Session() as sess, sess.begin():
+            # CREATE INDEX takes a SHARE lock on the table even when the index exists, so check first
+            if sess.execute(text("SELECT to_regclass(:name)"), {"name": qualified_name}).scalar() is not None:
+                return
+            sess.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS {name} ON {preparer.format_table(self.table)} "
+                    f"USING hnsw (embedding {opclass}) "
+                    f"WITH (m = {int(self.vector_index.m)}, ef_construction = {int(self.vector_index.ef_construction)})"
+                )
+            )
+
+    def _apply_filters(self, stmt, filters: Any):
+        """Apply metadata filters the same way agno's PgVector searches do."""
+        if filters is None:
+            return stmt
+        if isinstance(filters, dict):
+            return stmt.where(self.table.c.meta_data.contains(filters))
+        return stmt.where(
+            and_(*(self._dsl_to_sqlalchemy(f.to_dict() if hasattr(f, "to_dict") else f, self.table) for f in filters))
+        )
+
+    def _distance(self, query_embedding: list[float]):
+        embedding = self.table.c.embedding
+        if self.distance == Distance.l2:
+            return embedding.l2_distance(query_embedding)
+        if self.distance == Distance.max_inner_product:
+            return embedding.max_inner_product(query_embedding)
+        return embedding.cosine_distance(query_embedding)
@@ -5,15 +5,35 @@ Database Session
 PostgreSQL database connection for AgentOS.
 """
 
+from functools import cache
+
 from agno.db.postgres import PostgresDb
+from sqlalchemy import Engine, create_engine
 
 from db.url import db_url
 
 DB_ID = "dash-db"
 
 
+@cache
+def get_db_engine() -> Engine:
+    """Get the shared SQLAlchemy engine.
+
+    Returns:
+        Engine with a single connection pool shared by every database client.
+    """
+    return create_engine(
+        db_url,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        pool_size=10,
+        max_overflow=20,
+    )
+
+
+@cache
 def get_postgres_db(contents_table: str | None = None) -> PostgresDb:
-    """Create a PostgresDb instance.
+    """Get a PostgresDb instance, reused across calls with the same arguments.
 
     Args:
         contents_table: Optional table name for storing knowledge contents.
@@ -22,5 +42,5 @@ def get_postgres_db(contents_table: str | None = None) -> PostgresDb:
         Configured PostgresDb instance.
     """
     if contents_table is not None:
-        return PostgresDb(id=DB_ID, db_url=db_url, knowledge_table=contents_table)
-    return PostgresDb(id=DB_ID, db_url=db_url)
+        return PostgresDb(id=DB_ID, db_url=db_url, db_engine=get_db_engine(), knowledge_table=contents_table)
+    return PostgresDb(id=DB_ID, db_url=db_url, db_engine=get_db_engine())
@@ -5,20 +5,33 @@ Database URL
 Build database connection URL from environment variables.
 """
 
-from os import getenv
+from collections.abc import Mapping
+from os import environ
 from urllib.parse import quote
 
+# (DB_<KEY> environment variable suffix, default)
+DB_URL_FIELDS = (
+    ("DRIVER", "postgresql+psycopg"),
+    ("USER", "ai"),
+    ("PASS", "ai"),
+    ("HOST", "localhost"),
+    ("PORT", "5432"),
+    ("DATABASE", "ai"),
+)
 
-def build_db_url() -> str:
-    """Build database URL from environment variables."""
-    driver = getenv("DB_DRIVER", "postgresql+psycopg")
-    user = getenv("DB_USER", "ai")
-    password = quote(getenv("DB_PASS", "ai"), safe="")
-    host = getenv("DB_HOST", "localhost")
-    port = getenv("DB_PORT", "5432")
-    database = getenv("DB_DATABASE", "ai")
 
-    return f"{driver}://{user}:{password}@{host}:{port}/{database}"
+def build_db_url(env: Mapping[str, str] | None = None) -> str:
+    """Build database URL from environment variables.
+
+    Args:
+        env: Mapping to read DB_* variables from. Defaults to os.environ.
+    """
+    if env is None:
+        env = environ
+    v = {key: env.get(f"DB_{key}", default) for key, default in DB_URL_FIELDS}
+    password = quote(v["PASS"], safe="")
+
+    return f"{v['DRIVER']}://{v['USER']}:{password}@{v['HOST']}:{v['PORT']}/{v['DATABASE']}"
 
 
 db_url = build_db_url()